@@ -2,7 +2,6 @@
 
 import sys
 
-from .bot import TelegramBot
 from .utils.config import Config
 from .utils.logger import configure_logging, get_logger
 
@@ -20,6 +19,10 @@ def main() -> None:
         logger.error("configuration_error", error=str(e))
         sys.exit(1)
 
+    # Import the bot only once config is valid; telegram.ext pulls in a large
+    # dependency tree that a failed startup shouldn't pay for
+    from .bot import TelegramBot
+
     # Initialize and run bot
     bot = TelegramBot()
 
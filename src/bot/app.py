@@ -1,5 +1,7 @@
 """Main Telegram bot application."""
 
+import asyncio
+
 from telegram import BotCommand
 from telegram.ext import (
     Application,
@@ -45,6 +47,8 @@ class TelegramBot:
         self.app = (
             Application.builder()
             .token(Config.TELEGRAM_BOT_TOKEN)
+            .concurrent_updates(True)
+            .post_init(self._post_init)
             .build()
         )
 
@@ -88,15 +92,32 @@ class TelegramBot:
         except Exception as e:
             logger.error("bot_commands_set_failed", error=str(e))
 
+    async def _post_init(self, app: Application) -> None:
+        """Run startup tasks inside the application's event loop."""
+        await self._set_bot_commands()
+        await self._warm_active_workflow()
+
+    async def _warm_active_workflow(self) -> None:
+        """Load the active workflow ahead of the first message.
+
+        Runs before polling starts, in a worker thread since loading executes
+        the export's top-level code. Only the workflow cache is filled, so
+        the active workflow is still resolved from the store on first use.
+        """
+        workflow_name = self.workflow_manager.get_active_workflow_name()
+        if not workflow_name:
+            return
+
+        workflow = await asyncio.to_thread(self.workflow_manager.load_workflow, workflow_name)
+        if workflow:
+            logger.info("active_workflow_warmed", workflow=workflow_name)
+
     def run(self) -> None:
         """Start the bot."""
         logger.info("bot_starting")
 
-        # Set commands on startup
-        import asyncio
-        asyncio.get_event_loop().run_until_complete(self._set_bot_commands())
-
-        self.app.run_polling(allowed_updates=["message"])
+        # Long-poll getUpdates for up to 20s to cut idle round trips
+        self.app.run_polling(allowed_updates=["message"], timeout=20, poll_interval=0.0)
 
     def stop(self) -> None:
         """Stop the bot and cleanup."""
@@ -1,7 +1,12 @@
 """Telegram bot command and message handlers (single-user mode)."""
 
-from typing import List, Dict
-from telegram import Update
+import asyncio
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import List, Dict, Optional
+from telegram import Document, Update
 from telegram.ext import ContextTypes
 
 from ..workflow import WorkflowManager
@@ -11,6 +16,24 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Valid (normalized) workflow names
+_NAME_RE = re.compile(r"^[a-z0-9_]+$")
+
+
+def _normalize_workflow_name(raw_name: str) -> Optional[str]:
+    """Normalize user-provided text into a workflow name.
+
+    Args:
+        raw_name: Name as typed by the user or taken from a file name
+
+    Returns:
+        Normalized workflow name, or None if it contains invalid characters
+    """
+    workflow_name = raw_name.strip().replace(" ", "_").lower()
+    if not _NAME_RE.fullmatch(workflow_name):
+        return None
+    return workflow_name
+
 
 class BotHandlers:
     """Handler methods for Telegram bot commands (single-user mode)."""
@@ -28,6 +51,18 @@ class BotHandlers:
         """
         self.workflow_manager = workflow_manager
         self.commands = commands or []
+        self._log = logger.bind(module="handlers")
+
+        # Commands are static after load, so render the help text once
+        self._help_message = CommandLoader.format_help_message(self.commands)
+
+        # Per-chat message batching: buffered texts and their pending flush task
+        self._pending: Dict[int, List[str]] = {}
+        self._flush_tasks: Dict[int, asyncio.Task] = {}
+
+        # Album uploads: documents collected per media group and their flush task
+        self._media_groups: Dict[str, List[Document]] = {}
+        self._media_group_tasks: Dict[str, asyncio.Task] = {}
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /start command."""
@@ -45,8 +80,7 @@ class BotHandlers:
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
-        help_message = CommandLoader.format_help_message(self.commands)
-        await update.message.reply_text(help_message, parse_mode="Markdown")
+        await update.message.reply_text(self._help_message, parse_mode="Markdown")
 
     async def upload(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /upload command."""
@@ -56,6 +90,7 @@ class BotHandlers:
         )
 
         # Store state to expect file upload
+        self._discard_pending_upload(context)
         context.user_data["awaiting_workflow_upload"] = True
         context.user_data["workflow_update_name"] = None
 
@@ -87,6 +122,7 @@ class BotHandlers:
         )
 
         # Store state to expect file upload for update
+        self._discard_pending_upload(context)
         context.user_data["awaiting_workflow_upload"] = True
         context.user_data["workflow_update_name"] = workflow_name
 
@@ -102,37 +138,53 @@ class BotHandlers:
 
         # Validate file type
         if not document.file_name.endswith(Config.ACCEPTED_FILE_TYPES):
-            accepted_types = ", ".join(Config.ACCEPTED_FILE_TYPES)
             await update.message.reply_text(
-                f"❌ Please upload a workflow file with one of these extensions: {accepted_types}"
+                "❌ Please upload a workflow file with one of these extensions: "
+                f"{Config.ACCEPTED_FILE_TYPES_DISPLAY}"
+            )
+            return
+
+        # Albums: collect the whole media group and register the files together
+        media_group_id = update.message.media_group_id
+        if media_group_id and context.user_data.get("workflow_update_name") is None:
+            self._media_groups.setdefault(media_group_id, []).append(document)
+
+            flush_task = self._media_group_tasks.get(media_group_id)
+            if flush_task is not None:
+                flush_task.cancel()
+
+            self._media_group_tasks[media_group_id] = context.application.create_task(
+                self._flush_media_group(media_group_id, update, context),
+                update=update
             )
             return
 
         try:
-            # Download file
-            file = await context.bot.get_file(document.file_id)
-            file_content = await file.download_as_bytearray()
+            # Download file straight to disk
+            file_path = await self._download_document(document, context)
 
             # Check if this is an update or new upload
             is_update = context.user_data.get("workflow_update_name") is not None
 
             if is_update:
-                # Update existing workflow - save immediately
+                # Update existing workflow - acknowledge, then validate and save
                 workflow_name = context.user_data["workflow_update_name"]
 
-                success = self.workflow_manager.save_workflow(
+                status_message = await update.message.reply_text("⏳ Validating workflow...")
+
+                success = await self.workflow_manager.save_workflow_from_path(
                     workflow_name=workflow_name,
-                    file_content=bytes(file_content),
+                    source_path=file_path,
                     is_update=True
                 )
 
                 if not success:
-                    await update.message.reply_text(
+                    await status_message.edit_text(
                         "❌ Failed to save workflow. Please ensure the file contains valid workflow code with a `run_workflow()` function."
                     )
                     return
 
-                await update.message.reply_text(
+                await status_message.edit_text(
                     f"✅ Workflow '*{workflow_name}*' updated successfully!",
                     parse_mode="Markdown"
                 )
@@ -140,8 +192,9 @@ class BotHandlers:
                 context.user_data["awaiting_workflow_upload"] = False
                 context.user_data["workflow_update_name"] = None
             else:
-                # New upload - store file content and ask for name
-                context.user_data["pending_workflow_file"] = bytes(file_content)
+                # New upload - store file path and ask for name
+                self._discard_pending_upload(context)
+                context.user_data["pending_workflow_path"] = file_path
                 context.user_data["awaiting_workflow_upload"] = False
                 context.user_data["awaiting_workflow_name"] = True
 
@@ -152,11 +205,117 @@ class BotHandlers:
                 )
 
         except Exception as e:
-            logger.error("document_upload_failed", error=str(e))
+            self._log.error("document_upload_failed", error=str(e))
             await update.message.reply_text(
                 "❌ An error occurred while processing your file. Please try again."
             )
 
+    async def _flush_media_group(
+        self,
+        media_group_id: str,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        """Download and register every workflow file uploaded as one album.
+
+        Each workflow is named after its file name. Downloads run concurrently.
+
+        Args:
+            media_group_id: Media group the documents belong to
+            update: Update of the most recent document in the group
+            context: Handler context
+        """
+        await asyncio.sleep(Config.MEDIA_GROUP_WINDOW)
+
+        del self._media_group_tasks[media_group_id]
+        documents = self._media_groups.pop(media_group_id)
+        context.user_data["awaiting_workflow_upload"] = False
+
+        downloads = await asyncio.gather(
+            *(self._download_document(document, context) for document in documents),
+            return_exceptions=True
+        )
+
+        saved = []
+        lines = ["📤 *Album upload:*", ""]
+
+        for document, file_path in zip(documents, downloads):
+            if isinstance(file_path, BaseException):
+                self._log.error("document_upload_failed", error=str(file_path))
+                lines.append(f"❌ `{document.file_name}`: download failed")
+                continue
+
+            workflow_name = _normalize_workflow_name(Path(document.file_name).stem)
+
+            if workflow_name is None:
+                file_path.unlink(missing_ok=True)
+                lines.append(f"❌ `{document.file_name}`: invalid workflow name")
+                continue
+
+            if self.workflow_manager.workflow_exists(workflow_name):
+                file_path.unlink(missing_ok=True)
+                lines.append(f"❌ *{workflow_name}* already exists (use `/update {workflow_name}`)")
+                continue
+
+            success = await self.workflow_manager.save_workflow_from_path(
+                workflow_name=workflow_name,
+                source_path=file_path,
+                is_update=False
+            )
+
+            if success:
+                saved.append(workflow_name)
+                lines.append(f"✅ *{workflow_name}* created")
+            else:
+                lines.append(f"❌ *{workflow_name}*: no valid `run_workflow()` function")
+
+        # Activate the first new workflow if none is active yet
+        if saved and not self.workflow_manager.get_active_workflow_name():
+            if self.workflow_manager.activate_workflow(saved[0]):
+                lines.append("")
+                lines.append(f"🔄 Activated *{saved[0]}*. Ready to chat!")
+
+        await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+
+    async def _download_document(
+        self,
+        document: Document,
+        context: ContextTypes.DEFAULT_TYPE
+    ) -> Path:
+        """Download an uploaded document to a temporary file.
+
+        Args:
+            document: Telegram document to download
+            context: Handler context
+
+        Returns:
+            Path to the downloaded file
+        """
+        # Stage in the workflows directory so installing it is a rename
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=self.workflow_manager.workflows_dir)
+        os.close(fd)
+        file_path = Path(tmp_name)
+
+        try:
+            file = await context.bot.get_file(document.file_id)
+            await file.download_to_drive(file_path)
+        except Exception:
+            file_path.unlink(missing_ok=True)
+            raise
+
+        return file_path
+
+    def _discard_pending_upload(self, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Delete a downloaded file still waiting for a workflow name.
+
+        Args:
+            context: Handler context
+        """
+        file_path = context.user_data.pop("pending_workflow_path", None)
+        context.user_data["awaiting_workflow_name"] = False
+        if file_path is not None:
+            file_path.unlink(missing_ok=True)
+
     async def workflows(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /workflows command."""
         workflows = self.workflow_manager.list_workflows()
@@ -169,12 +328,14 @@ class BotHandlers:
             )
             return
 
-        response = "📋 *Your Workflows:*\n\n"
+        lines = ["📋 *Your Workflows:*", ""]
         for wf in workflows:
             active_marker = "🔄 " if wf["name"] == active_workflow else "   "
-            response += f"{active_marker}*{wf['name']}*\n"
+            lines.append(f"{active_marker}*{wf['name']}*")
 
-        response += f"\n💬 Active: *{active_workflow or 'None'}*"
+        lines.append("")
+        lines.append(f"💬 Active: *{active_workflow or 'None'}*")
+        response = "\n".join(lines)
 
         await update.message.reply_text(response, parse_mode="Markdown")
 
@@ -233,7 +394,7 @@ class BotHandlers:
 
     async def info(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /info command."""
-        active_workflow_name = self.workflow_manager.get_active_workflow_name()
+        active_workflow_name, workflow = self.workflow_manager.get_active()
 
         if not active_workflow_name:
             await update.message.reply_text(
@@ -241,8 +402,6 @@ class BotHandlers:
             )
             return
 
-        workflow = self.workflow_manager.get_active_workflow()
-
         if not workflow:
             await update.message.reply_text(
                 "❌ Could not load active workflow."
@@ -263,10 +422,10 @@ class BotHandlers:
 
         # STATE: Expecting workflow name (after file upload)
         if context.user_data.get("awaiting_workflow_name") is True:
-            workflow_name = message_text.strip().replace(" ", "_").lower()
+            workflow_name = _normalize_workflow_name(message_text)
 
             # Validate name
-            if not workflow_name.replace("_", "").isalnum():
+            if workflow_name is None:
                 await update.message.reply_text(
                     "❌ Workflow name can only contain letters, numbers, and underscores.\n"
                     "Please provide a valid name."
@@ -282,20 +441,22 @@ class BotHandlers:
                 )
                 return
 
-            # Get stored file content and save workflow
-            file_content = context.user_data.get("pending_workflow_file")
-            success = self.workflow_manager.save_workflow(
+            # Clear state before validating so a repeated name isn't handled twice
+            file_path = context.user_data.get("pending_workflow_path")
+            context.user_data["awaiting_workflow_name"] = False
+            context.user_data["pending_workflow_path"] = None
+
+            # Acknowledge, then validate and save the stored file
+            status_message = await update.message.reply_text("⏳ Validating workflow...")
+
+            success = await self.workflow_manager.save_workflow_from_path(
                 workflow_name=workflow_name,
-                file_content=file_content,
+                source_path=file_path,
                 is_update=False
             )
 
-            # Clear state
-            context.user_data["awaiting_workflow_name"] = False
-            context.user_data["pending_workflow_file"] = None
-
             if not success:
-                await update.message.reply_text(
+                await status_message.edit_text(
                     "❌ Failed to save workflow. Please ensure the file contains valid workflow code with a `run_workflow()` function."
                 )
                 return
@@ -304,21 +465,56 @@ class BotHandlers:
             workflows = self.workflow_manager.list_workflows()
             if len(workflows) == 1:
                 self.workflow_manager.activate_workflow(workflow_name)
-                await update.message.reply_text(
+                await status_message.edit_text(
                     f"✅ Workflow '*{workflow_name}*' created and activated!\n"
                     f"Ready to chat!",
                     parse_mode="Markdown"
                 )
             else:
-                await update.message.reply_text(
+                await status_message.edit_text(
                     f"✅ Workflow '*{workflow_name}*' created!\n"
                     f"Use `/activate {workflow_name}` to switch to it.",
                     parse_mode="Markdown"
                 )
             return
 
-        # NORMAL STATE: Chat with active workflow
-        active_workflow_name = self.workflow_manager.get_active_workflow_name()
+        # NORMAL STATE: Buffer the message and (re)schedule a batched workflow run
+        chat_id = update.effective_chat.id
+        self._pending.setdefault(chat_id, []).append(message_text)
+
+        flush_task = self._flush_tasks.get(chat_id)
+        if flush_task is not None:
+            flush_task.cancel()
+
+        self._flush_tasks[chat_id] = context.application.create_task(
+            self._flush(chat_id, update, context),
+            update=update
+        )
+
+    async def _flush(
+        self,
+        chat_id: int,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        """Run the active workflow on the messages buffered for a chat.
+
+        Waits out the batching window first; a newer message in the same chat
+        cancels this call and schedules a fresh one.
+
+        Args:
+            chat_id: Chat whose buffered messages should be sent
+            update: Update of the most recent message in the batch
+            context: Handler context
+        """
+        await asyncio.sleep(Config.MESSAGE_BATCH_WINDOW)
+
+        # Window closed: detach so messages arriving from now on start a new batch
+        del self._flush_tasks[chat_id]
+        message_text = "\n".join(self._pending.pop(chat_id))
+
+        # Chat with active workflow
+        active_workflow_name, workflow = self.workflow_manager.get_active()
 
         if not active_workflow_name:
             await update.message.reply_text(
@@ -326,48 +522,57 @@ class BotHandlers:
             )
             return
 
-        workflow = self.workflow_manager.get_active_workflow()
-
         if not workflow:
             await update.message.reply_text(
                 "❌ Could not load active workflow. Please try /activate again."
             )
             return
 
-        try:
-            # Send loading message immediately
-            loading_message = await update.message.reply_text(
-                f"🔄 *[{active_workflow_name}]*\n\n⏳ Processing your request...",
-                parse_mode="Markdown"
-            )
+        # Serialize workflow runs per chat so replies keep their order,
+        # while other chats are processed concurrently
+        lock = context.chat_data.setdefault("lock", asyncio.Lock())
 
-            # Run workflow directly
-            response = await workflow.run(message_text)
+        async with lock:
+            loading_message = None
 
-            # Format response with workflow header
-            formatted_response = f"🔄 *[{active_workflow_name}]*\n\n{response}"
+            try:
+                # Send loading message immediately
+                loading_message = await update.message.reply_text(
+                    f"🔄 *[{active_workflow_name}]*\n\n⏳ Processing your request...",
+                    parse_mode="Markdown"
+                )
 
-            # Update the loading message with the actual response
-            await loading_message.edit_text(
-                formatted_response,
-                parse_mode="Markdown"
-            )
+                # Run workflow directly
+                response = await workflow.run(message_text)
 
-        except Exception as e:
-            logger.error("message_handling_failed", error=str(e))
+                # Format response with workflow header
+                formatted_response = f"🔄 *[{active_workflow_name}]*\n\n{response}"
 
-            # Try to update the loading message with error, or send new message if that fails
-            try:
-                if 'loading_message' in locals():
-                    await loading_message.edit_text(
-                        "❌ An error occurred while processing your message. Please try again."
-                    )
-                else:
+                # Update the loading message with the actual response
+                await loading_message.edit_text(
+                    formatted_response,
+                    parse_mode="Markdown"
+                )
+
+            except Exception as e:
+                self._log.error(
+                    "message_handling_failed",
+                    workflow=active_workflow_name,
+                    error=str(e)
+                )
+
+                # Try to update the loading message with error, or send new message if that fails
+                try:
+                    if loading_message is not None:
+                        await loading_message.edit_text(
+                            "❌ An error occurred while processing your message. Please try again."
+                        )
+                    else:
+                        await update.message.reply_text(
+                            "❌ An error occurred while processing your message. Please try again."
+                        )
+                except Exception:
+                    # If editing fails, just send a new message
                     await update.message.reply_text(
                         "❌ An error occurred while processing your message. Please try again."
                     )
-            except Exception:
-                # If editing fails, just send a new message
-                await update.message.reply_text(
-                    "❌ An error occurred while processing your message. Please try again."
-                )
@@ -1,6 +1,7 @@
 """Simple JSON-based workflow storage (single-user)."""
 
 import json
+import os
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -18,10 +19,17 @@ class WorkflowStore:
         Args:
             config_path: Path to JSON config file
         """
+        self._log = logger.bind(module="storage")
         self.config_path = config_path
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # In-memory copy of the config, reloaded only when the file changes
+        self._cache: Dict[str, Any] = {"active": None, "workflows": {}}
+        self._mtime: Optional[float] = None
+
         self._ensure_config()
-        logger.info("workflow_store_initialized", path=str(config_path))
+        self._cache = self._load_config()
+        self._log.info("workflow_store_initialized", path=str(config_path))
 
     def _ensure_config(self) -> None:
         """Ensure config file exists with default structure."""
@@ -32,21 +40,31 @@ class WorkflowStore:
             })
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load config from JSON file."""
+        """Load config from JSON file, reusing the cached copy if unchanged on disk."""
         try:
-            with open(self.config_path, "r") as f:
-                return json.load(f)
+            mtime = os.stat(self.config_path).st_mtime
+            if mtime == self._mtime:
+                return self._cache
+
+            self._cache = json.loads(self.config_path.read_bytes())
+            self._mtime = mtime
+            return self._cache
         except Exception as e:
-            logger.error("config_load_failed", error=str(e))
+            self._log.error("config_load_failed", error=str(e))
             return {"active": None, "workflows": {}}
 
     def _save_config(self, config: Dict[str, Any]) -> None:
-        """Save config to JSON file."""
+        """Save config to JSON file and refresh the cached copy."""
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            # Write to a sibling temp file and swap it in atomically so a crash
+            # mid-write can't leave a truncated registry behind
+            tmp_path = self.config_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(config, indent=2))
+            os.replace(tmp_path, self.config_path)
+            self._cache = config
+            self._mtime = os.stat(self.config_path).st_mtime
         except Exception as e:
-            logger.error("config_save_failed", error=str(e))
+            self._log.error("config_save_failed", error=str(e))
 
     def get_active_workflow(self) -> Optional[str]:
         """Get the active workflow name.
@@ -54,7 +72,7 @@ class WorkflowStore:
         Returns:
             Active workflow name or None
         """
-        config = self._load_config()
+        config = self._cache
         return config.get("active")
 
     def set_active_workflow(self, workflow_name: Optional[str]) -> None:
@@ -66,7 +84,7 @@ class WorkflowStore:
         config = self._load_config()
         config["active"] = workflow_name
         self._save_config(config)
-        logger.info("active_workflow_set", workflow=workflow_name)
+        self._log.info("active_workflow_set", workflow=workflow_name)
 
     def add_workflow(
         self,
@@ -87,7 +105,7 @@ class WorkflowStore:
             "metadata": metadata or {}
         }
         self._save_config(config)
-        logger.info("workflow_registered", workflow=workflow_name)
+        self._log.info("workflow_registered", workflow=workflow_name)
 
     def get_workflow(self, workflow_name: str) -> Optional[Dict[str, Any]]:
         """Get workflow info.
@@ -98,7 +116,7 @@ class WorkflowStore:
         Returns:
             Workflow info dict or None
         """
-        config = self._load_config()
+        config = self._cache
         workflow_data = config["workflows"].get(workflow_name)
         if workflow_data:
             return {
@@ -114,7 +132,7 @@ class WorkflowStore:
         Returns:
             List of workflow info dicts
         """
-        config = self._load_config()
+        config = self._cache
         workflows = []
         for name, data in config["workflows"].items():
             workflows.append({
@@ -142,7 +160,7 @@ class WorkflowStore:
                 config["active"] = None
 
             self._save_config(config)
-            logger.info("workflow_removed", workflow=workflow_name)
+            self._log.info("workflow_removed", workflow=workflow_name)
             return True
         return False
 
@@ -155,5 +173,8 @@ class WorkflowStore:
         Returns:
             True if workflow exists, False otherwise
         """
-        config = self._load_config()
-        return workflow_name in config["workflows"]
+        return workflow_name in self
+
+    def __contains__(self, workflow_name: str) -> bool:
+        """Check workflow membership against the in-memory config."""
+        return workflow_name in self._cache["workflows"]
@@ -8,6 +8,16 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Help message group for each command (None = hidden, missing = general)
+_GROUPS = {
+    **dict.fromkeys(["upload", "update", "workflows", "activate", "remove"], "workflow"),
+    **dict.fromkeys(["info"], "conversation"),
+    "start": None,
+}
+
+# Commands that take a workflow name argument
+_NAME_ARG_COMMANDS = frozenset(["update", "activate", "remove"])
+
 
 class CommandLoader:
     """Load and format bot commands."""
@@ -51,41 +61,41 @@ class CommandLoader:
         general_commands = []
 
         for cmd in commands:
-            command = cmd["command"]
-            if command in ["upload", "update", "workflows", "activate", "remove"]:
+            group = _GROUPS.get(cmd["command"], "general")
+            if group is None:
+                continue
+            elif group == "workflow":
                 workflow_commands.append(cmd)
-            elif command in ["info"]:
+            elif group == "conversation":
                 conversation_commands.append(cmd)
-            elif command in ["start"]:
-                continue
             else:
                 general_commands.append(cmd)
 
         # Build message
-        message = "🔧 *Available Commands:*\n\n"
+        parts = ["🔧 *Available Commands:*\n\n"]
 
         if workflow_commands:
-            message += "*Workflow Management:*\n"
+            parts.append("*Workflow Management:*\n")
             for cmd in workflow_commands:
                 # Add usage hints for commands with parameters
                 usage = ""
-                if cmd["command"] in ["update", "activate", "remove"]:
-                    usage = f" <name>"
-                message += f"/{cmd['command']}{usage} - {cmd['description']}\n"
-            message += "\n"
+                if cmd["command"] in _NAME_ARG_COMMANDS:
+                    usage = " <name>"
+                parts.append(f"/{cmd['command']}{usage} - {cmd['description']}\n")
+            parts.append("\n")
 
         if conversation_commands:
-            message += "*Conversation:*\n"
+            parts.append("*Conversation:*\n")
             for cmd in conversation_commands:
-                message += f"/{cmd['command']} - {cmd['description']}\n"
-            message += "\n"
+                parts.append(f"/{cmd['command']} - {cmd['description']}\n")
+            parts.append("\n")
 
         if general_commands:
-            message += "*General:*\n"
+            parts.append("*General:*\n")
             for cmd in general_commands:
-                message += f"/{cmd['command']} - {cmd['description']}\n"
-            message += "\n"
+                parts.append(f"/{cmd['command']} - {cmd['description']}\n")
+            parts.append("\n")
 
-        message += "💬 Just send a message to chat with your active workflow!"
+        parts.append("💬 Just send a message to chat with your active workflow!")
 
-        return message
+        return "".join(parts)
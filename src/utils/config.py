@@ -17,6 +17,13 @@ class Config:
 
     # Accepted file extensions for workflow uploads
     ACCEPTED_FILE_TYPES: tuple = (".py", ".txt")
+    ACCEPTED_FILE_TYPES_DISPLAY: str = ", ".join(ACCEPTED_FILE_TYPES)
+
+    # Seconds to wait for further chat messages before running the workflow on the batch
+    MESSAGE_BATCH_WINDOW: float = 0.2
+
+    # Seconds to wait for the rest of an album before registering its workflow files
+    MEDIA_GROUP_WINDOW: float = 0.3
 
     @classmethod
     def validate(cls) -> None:
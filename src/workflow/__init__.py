@@ -1,6 +1,6 @@
 """Workflow management modules."""
 
-from .loader import WorkflowLoader
+from .loader import WorkflowLoader, load_workflow, validate_workflow_file
 from .manager import WorkflowManager
 
-__all__ = ["WorkflowLoader", "WorkflowManager"]
+__all__ = ["WorkflowLoader", "WorkflowManager", "load_workflow", "validate_workflow_file"]
@@ -1,21 +1,86 @@
 """Dynamic workflow loading from exported Python files."""
 
+import functools
 import importlib.util
+import os
 import sys
+import threading
+from importlib.machinery import SourceFileLoader
 from pathlib import Path
-from typing import Callable
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple
 from abc import ABC, abstractmethod
 
-from pydantic import BaseModel
-
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Source loaders by workflow module name
+_LOADERS: Dict[str, SourceFileLoader] = {}
+
+# Serializes swaps of workflow modules in sys.modules (loads run in worker threads too)
+_MODULES_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fallback_input_cls() -> type:
+    """Build the input model for exports that don't define their own WorkflowInput.
+
+    pydantic is imported here so importing this module doesn't pull it in.
+    """
+    from pydantic import BaseModel
+
+    class WorkflowInputFallback(BaseModel):
+        input_as_text: str
+
+    return WorkflowInputFallback
+
+
+def _file_stamp(file_path: Path, st: os.stat_result) -> Tuple[str, int, int]:
+    """Identify the file a workflow module was executed from."""
+    return str(file_path), st.st_mtime_ns, st.st_size
+
+
+def _extract_response(result: Any) -> str:
+    """Extract the response text from any workflow result.
+
+    Args:
+        result: Value returned by run_workflow()
+
+    Returns:
+        Response text
+    """
+    # Agent Builder workflows return a dict with "output_text" key
+    if isinstance(result, dict) and "output_text" in result:
+        return result["output_text"]
+    elif isinstance(result, str):
+        return result
+    elif result is None:
+        return "Workflow completed with no output."
+    else:
+        return str(result)
+
+
+def _extract_output_text(result: Any) -> str:
+    """Extract the response from a dict result, falling back if the shape changes."""
+    try:
+        return result["output_text"]
+    except (KeyError, TypeError):
+        return _extract_response(result)
+
+
+def _extract_str(result: Any) -> str:
+    """Return a str result as-is, falling back if the shape changes."""
+    if type(result) is str:
+        return result
+    return _extract_response(result)
+
 
 class Workflow(ABC):
     """Abstract base class for workflows."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def run(self, user_input: str) -> str:
         """Run the workflow with user input.
@@ -48,16 +113,40 @@ class AgentBuilderWorkflow(Workflow):
     that orchestrates multiple agents with conditional logic.
     """
 
-    def __init__(self, run_workflow_func: Callable, workflow_name: str):
+    __slots__ = (
+        "_run_workflow", "_name", "_module", "_WorkflowInput", "_make_input", "_extract_result"
+    )
+
+    def __init__(
+        self,
+        run_workflow_func: Callable,
+        workflow_name: str,
+        module: Optional[ModuleType] = None
+    ):
         """Initialize Agent Builder workflow.
 
         Args:
             run_workflow_func: The exported run_workflow() function
             workflow_name: Name of the workflow
+            module: The exported module (defaults to the one registered for the function)
         """
         self._run_workflow = run_workflow_func
         self._name = workflow_name
 
+        # Agent Builder workflows expect WorkflowInput with input_as_text, defined
+        # in the exported module: class WorkflowInput(BaseModel): input_as_text: str
+        if module is None:
+            module = sys.modules.get(run_workflow_func.__module__)
+        self._module = module
+        self._WorkflowInput = getattr(module, "WorkflowInput", None) or _get_fallback_input_cls()
+
+        # The input is always a str from our own handler, so skip pydantic v2
+        # validation when available
+        self._make_input = getattr(self._WorkflowInput, "model_construct", self._WorkflowInput)
+
+        # Result extraction, specialized on the first observed result type
+        self._extract_result: Callable[[Any], str] = self._extract_first
+
     async def run(self, user_input: str) -> str:
         """Run the Agent Builder workflow.
 
@@ -67,116 +156,175 @@ class AgentBuilderWorkflow(Workflow):
         Returns:
             Workflow response
         """
-        try:
-            # Agent Builder workflows expect WorkflowInput with input_as_text
-            # The function is defined in the module: class WorkflowInput(BaseModel): input_as_text: str
-            # We need to dynamically create an instance
-
-            # Get the WorkflowInput class from the function's module
-            workflow_module = self._run_workflow.__module__
-            module = sys.modules[workflow_module]
-
-            if hasattr(module, "WorkflowInput"):
-                WorkflowInput = module.WorkflowInput
-                workflow_input = WorkflowInput(input_as_text=user_input)
-            else:
-                # Fallback: create a basic input dict
-                class WorkflowInputFallback(BaseModel):
-                    input_as_text: str
-                workflow_input = WorkflowInputFallback(input_as_text=user_input)
-
-            # Run the workflow and capture result
-            result = await self._run_workflow(workflow_input)
-
-            # Extract response from result
-            # Agent Builder workflows return a dict with "output_text" key
-            if isinstance(result, dict) and "output_text" in result:
-                return result["output_text"]
-            elif isinstance(result, str):
-                return result
-            elif result is None:
-                return "Workflow completed with no output."
-            else:
-                return str(result)
+        workflow_input = self._make_input(input_as_text=user_input)
+
+        # Run the workflow and capture result (errors propagate to the caller)
+        result = await self._run_workflow(workflow_input)
+
+        return self._extract_result(result)
+
+    def _extract_first(self, result: Any) -> str:
+        """Extract the first response and specialize extraction on its type.
 
-        except Exception as e:
-            logger.error("agent_builder_workflow_failed", workflow=self._name, error=str(e))
-            raise
+        An export returns the same result shape for its lifetime, so later
+        calls go straight to the matching extractor.
+        """
+        if isinstance(result, dict) and "output_text" in result:
+            self._extract_result = _extract_output_text
+        elif isinstance(result, str):
+            self._extract_result = _extract_str
+        else:
+            self._extract_result = _extract_response
+
+        return _extract_response(result)
 
     @property
     def name(self) -> str:
         """Get workflow name."""
         return self._name
 
+    @property
+    def module(self) -> Optional[ModuleType]:
+        """Get the exported module the workflow runs from."""
+        return self._module
+
     @property
     def description(self) -> str:
         """Get workflow description."""
         return f"Agent Builder workflow: {self._name}"
 
 
-class WorkflowLoader:
-    """Load and validate exported Agent Builder workflows."""
-
-    @staticmethod
-    def load_workflow(file_path: Path) -> Workflow:
-        """Dynamically load a workflow from a Python file.
+def load_workflow(file_path: Path, workflow_name: Optional[str] = None) -> Workflow:
+    """Dynamically load a workflow from a Python file.
 
-        Only supports Agent Builder exports with `run_workflow()` async function.
+    Only supports Agent Builder exports with `run_workflow()` async function.
 
-        Args:
-            file_path: Path to the workflow Python file
+    Args:
+        file_path: Path to the workflow Python file
+        workflow_name: Name for the workflow and its module (defaults to the file stem)
 
-        Returns:
-            Loaded Workflow instance
+    Returns:
+        Loaded Workflow instance
 
-        Raises:
-            ValueError: If file cannot be loaded or doesn't contain a valid workflow
-            FileNotFoundError: If file doesn't exist
-        """
-        if not file_path.exists():
-            raise FileNotFoundError(f"Workflow file not found: {file_path}")
-
-        try:
+    Raises:
+        ValueError: If file cannot be loaded or doesn't contain a valid workflow
+        FileNotFoundError: If file doesn't exist
+    """
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Workflow file not found: {file_path}") from None
+
+    with _MODULES_LOCK:
+        return _load_module_workflow(file_path, st, workflow_name)
+
+
+def _load_module_workflow(
+    file_path: Path,
+    st: os.stat_result,
+    workflow_name: Optional[str]
+) -> Workflow:
+    """Execute (or reuse) a workflow module and wrap it; caller holds _MODULES_LOCK."""
+    # Reuse the registered module if it was executed from the unchanged file
+    workflow_name = workflow_name or file_path.stem
+    module_name = f"workflow_{workflow_name}"
+    previous = sys.modules.get(module_name)
+    module = previous
+
+    try:
+        if module is None or getattr(module, "__wf_stamp__", None) != _file_stamp(file_path, st):
             # Load module from file
-            spec = importlib.util.spec_from_file_location(
-                f"workflow_{file_path.stem}",
-                file_path
-            )
+            # Explicit loader so staged files without a .py suffix load too;
+            # reused across reloads of the same module from the same file
+            loader = _LOADERS.get(module_name)
+            if loader is None or loader.path != str(file_path):
+                loader = _LOADERS[module_name] = SourceFileLoader(module_name, str(file_path))
+
+            spec = importlib.util.spec_from_loader(module_name, loader)
             if not spec or not spec.loader:
                 raise ValueError(f"Cannot load module from {file_path}")
 
             module = importlib.util.module_from_spec(spec)
             sys.modules[spec.name] = module
             spec.loader.exec_module(module)
+            module.__wf_stamp__ = _file_stamp(file_path, st)
+
+        # Check for Agent Builder pattern (run_workflow function)
+        if hasattr(module, "run_workflow") and callable(module.run_workflow):
+            logger.info("agent_builder_workflow_loaded", file_path=str(file_path), workflow=workflow_name)
+            return AgentBuilderWorkflow(module.run_workflow, workflow_name, module)
+
+        # No valid workflow found
+        raise ValueError(
+            "No run_workflow() function found in file. "
+            "Please upload a workflow exported from OpenAI Agent Builder."
+        )
+
+    except Exception as e:
+        # Put back the module this one replaced, like the import system does
+        if module is not previous:
+            if previous is None:
+                sys.modules.pop(module_name, None)
+            else:
+                sys.modules[module_name] = previous
 
-            # Check for Agent Builder pattern (run_workflow function)
-            if hasattr(module, "run_workflow") and callable(module.run_workflow):
-                workflow_name = file_path.stem
-                logger.info("agent_builder_workflow_loaded", file_path=str(file_path), workflow=workflow_name)
-                return AgentBuilderWorkflow(module.run_workflow, workflow_name)
+        logger.error("workflow_load_failed", file_path=str(file_path), error=str(e))
+        raise ValueError(f"Failed to load workflow: {e}")
 
-            # No valid workflow found
-            raise ValueError(
-                "No run_workflow() function found in file. "
-                "Please upload a workflow exported from OpenAI Agent Builder."
-            )
 
-        except Exception as e:
-            logger.error("workflow_load_failed", file_path=str(file_path), error=str(e))
-            raise ValueError(f"Failed to load workflow: {e}")
+def restamp_workflow_module(module: ModuleType, file_path: Path) -> None:
+    """Re-home a loaded workflow module onto the file its source was moved to.
 
-    @staticmethod
-    def validate_workflow_file(file_path: Path) -> bool:
-        """Validate that a file contains a loadable workflow.
+    Points the module's file attributes and loader at the new path so
+    tracebacks and `__file__`-relative paths keep working, and registers and
+    stamps it so later loads of the file reuse it.
 
-        Args:
-            file_path: Path to workflow file
+    Args:
+        module: Module executed from the file before it was moved
+        file_path: New path of the module's source file
+    """
+    st = file_path.stat()
 
-        Returns:
-            True if valid, False otherwise
-        """
-        try:
-            WorkflowLoader.load_workflow(file_path)
-            return True
-        except Exception:
-            return False
+    with _MODULES_LOCK:
+        module.__file__ = str(file_path)
+        module.__cached__ = importlib.util.cache_from_source(str(file_path))
+        if module.__spec__ is not None:
+            module.__spec__.origin = module.__file__
+        if isinstance(module.__loader__, SourceFileLoader):
+            module.__loader__.path = module.__file__
+
+        module.__wf_stamp__ = _file_stamp(file_path, st)
+
+        # A load of the old file may have registered another module meanwhile
+        sys.modules[module.__name__] = module
+
+
+def validate_workflow_file(
+    file_path: Path,
+    workflow_name: Optional[str] = None
+) -> Optional[Workflow]:
+    """Validate that a file contains a loadable workflow.
+
+    Args:
+        file_path: Path to workflow file
+        workflow_name: Name for the workflow and its module (defaults to the file stem)
+
+    Returns:
+        The loaded Workflow if valid, None otherwise
+    """
+    try:
+        return load_workflow(file_path, workflow_name)
+    except (ValueError, FileNotFoundError):
+        # load_workflow has already logged the failure
+        return None
+
+
+class WorkflowLoader:
+    """Load and validate exported Agent Builder workflows.
+
+    Kept as a namespace for backwards compatibility; prefer the module-level
+    `load_workflow` and `validate_workflow_file` functions.
+    """
+
+    load_workflow = staticmethod(load_workflow)
+    validate_workflow_file = staticmethod(validate_workflow_file)
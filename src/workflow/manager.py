@@ -1,14 +1,23 @@
 """Workflow lifecycle management (single-user mode)."""
 
+import asyncio
+import importlib.util
+import py_compile
+import shutil
+import tempfile
+import time
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
 from ..storage import WorkflowStore
 from ..utils.logger import get_logger
-from .loader import WorkflowLoader, Workflow
+from .loader import Workflow, load_workflow, restamp_workflow_module, validate_workflow_file
 
 logger = get_logger(__name__)
 
+# Seconds between mtime checks of the cached active workflow file
+ACTIVE_RECHECK_INTERVAL = 5.0
+
 
 class WorkflowManager:
     """Manage workflows (single-user mode)."""
@@ -27,9 +36,15 @@ class WorkflowManager:
         # Cache loaded workflows
         self._workflow_cache: Dict[str, Workflow] = {}
 
+        # Cache workflow info from the store; changes only on save/remove
+        self._info_cache: Dict[str, Dict] = {}
+
+        # Cache the active workflow for the chat hot path, keyed by its file mtime
+        self._active_cache: Optional[Tuple[str, Path, int, float, Workflow]] = None
+
         logger.info("workflow_manager_initialized", dir=str(workflows_dir))
 
-    def save_workflow(
+    async def save_workflow(
         self,
         workflow_name: str,
         file_content: bytes,
@@ -46,33 +61,142 @@ class WorkflowManager:
             True if saved successfully, False otherwise
         """
         try:
-            # Save file
-            file_path = self.workflows_dir / f"{workflow_name}.py"
-            file_path.write_bytes(file_content)
-
-            # Validate it loads
-            if not WorkflowLoader.validate_workflow_file(file_path):
-                file_path.unlink()
-                return False
-
-            # Register in store
-            self.workflow_store.add_workflow(
-                workflow_name=workflow_name,
-                file_path=str(file_path)
+            # Stage the upload next to its final location
+            with tempfile.NamedTemporaryFile(
+                dir=self.workflows_dir,
+                suffix=".tmp",
+                delete=False
+            ) as staged_file:
+                staged_file.write(file_content)
+
+            return await self._install_workflow_file(
+                workflow_name,
+                Path(staged_file.name),
+                is_update
             )
 
-            # Clear cache for this workflow
-            if workflow_name in self._workflow_cache:
-                del self._workflow_cache[workflow_name]
+        except Exception as e:
+            logger.error("workflow_save_failed", workflow=workflow_name, error=str(e))
+            return False
 
-            action = "workflow_updated" if is_update else "workflow_saved"
-            logger.info(action, workflow=workflow_name)
-            return True
+    async def save_workflow_from_path(
+        self,
+        workflow_name: str,
+        source_path: Path,
+        is_update: bool = False
+    ) -> bool:
+        """Save a workflow from a file already on disk (e.g. a downloaded upload).
+
+        The source file is moved into the workflows directory if valid and
+        deleted otherwise.
+
+        Args:
+            workflow_name: Name for the workflow
+            source_path: Path to the uploaded workflow file
+            is_update: Whether this is an update to existing workflow
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        try:
+            return await self._install_workflow_file(workflow_name, source_path, is_update)
 
         except Exception as e:
             logger.error("workflow_save_failed", workflow=workflow_name, error=str(e))
             return False
 
+    async def _install_workflow_file(
+        self,
+        workflow_name: str,
+        staged_path: Path,
+        is_update: bool
+    ) -> bool:
+        """Validate a staged workflow file, move it into place and register it.
+
+        Validation executes the export's top-level code, so it runs in a worker
+        thread to keep the event loop serving other chats.
+
+        Args:
+            workflow_name: Name for the workflow
+            staged_path: Path to the staged workflow file (consumed)
+            is_update: Whether this is an update to existing workflow
+
+        Returns:
+            True if registered successfully, False if the file is invalid
+        """
+        workflow = await asyncio.to_thread(self._commit_staged_file, workflow_name, staged_path)
+        if workflow is None:
+            return False
+
+        # Register in store
+        self.workflow_store.add_workflow(
+            workflow_name=workflow_name,
+            file_path=str(self.workflows_dir / f"{workflow_name}.py")
+        )
+
+        # Cache the workflow loaded during validation so it isn't executed again
+        self._workflow_cache[workflow_name] = workflow
+        self._info_cache.pop(workflow_name, None)
+        if self._active_cache is not None and self._active_cache[0] == workflow_name:
+            self._active_cache = None
+
+        action = "workflow_updated" if is_update else "workflow_saved"
+        logger.info(action, workflow=workflow_name)
+        return True
+
+    def _commit_staged_file(self, workflow_name: str, staged_path: Path) -> Optional[Workflow]:
+        """Validate a staged workflow file and move it into place (blocking).
+
+        The existing workflow file is only replaced once the new one has loaded
+        successfully, so a bad update leaves the current version intact.
+
+        Args:
+            workflow_name: Name for the workflow
+            staged_path: Path to the staged workflow file (consumed)
+
+        Returns:
+            The loaded Workflow, or None if the file is invalid
+        """
+        # Validate it loads
+        try:
+            workflow = validate_workflow_file(staged_path, workflow_name)
+        finally:
+            # Drop bytecode the import system cached for the staged file
+            Path(importlib.util.cache_from_source(str(staged_path))).unlink(missing_ok=True)
+
+        if workflow is None:
+            staged_path.unlink(missing_ok=True)
+            return None
+
+        # Move into place (an atomic rename when staged in the workflows directory)
+        file_path = self.workflows_dir / f"{workflow_name}.py"
+        shutil.move(staged_path, file_path)
+
+        # The module loaded during validation now belongs to the installed file
+        restamp_workflow_module(workflow.module, file_path)
+
+        # Precompile bytecode so loads after a restart hit the __pycache__ fast path
+        py_compile.compile(str(file_path), doraise=False, quiet=1)
+
+        return workflow
+
+    def _get_workflow_info(self, workflow_name: str) -> Optional[Dict]:
+        """Get workflow info from the store, memoized until the workflow changes.
+
+        Args:
+            workflow_name: Workflow name
+
+        Returns:
+            Workflow info dict (with the file path pre-parsed under "_path") or None
+        """
+        workflow_info = self._info_cache.get(workflow_name)
+        if workflow_info is None:
+            workflow_info = self.workflow_store.get_workflow(workflow_name)
+            if workflow_info:
+                workflow_info["_path"] = Path(workflow_info["file_path"])
+                self._info_cache[workflow_name] = workflow_info
+        return workflow_info
+
     def load_workflow(self, workflow_name: str) -> Optional[Workflow]:
         """Load a workflow for execution.
 
@@ -87,14 +211,14 @@ class WorkflowManager:
             return self._workflow_cache[workflow_name]
 
         # Get workflow info
-        workflow_info = self.workflow_store.get_workflow(workflow_name)
+        workflow_info = self._get_workflow_info(workflow_name)
         if not workflow_info:
             return None
 
         try:
             # Load from file
-            file_path = Path(workflow_info["file_path"])
-            workflow = WorkflowLoader.load_workflow(file_path)
+            file_path = workflow_info["_path"]
+            workflow = load_workflow(file_path)
 
             # Cache it
             self._workflow_cache[workflow_name] = workflow
@@ -121,21 +245,67 @@ class WorkflowManager:
 
         # Set as active
         self.workflow_store.set_active_workflow(workflow_name)
+        self._active_cache = None
 
         logger.info("workflow_activated", workflow=workflow_name)
         return True
 
-    def get_active_workflow(self) -> Optional[Workflow]:
-        """Get the active workflow.
+    def get_active(self) -> Tuple[Optional[str], Optional[Workflow]]:
+        """Get the active workflow name and loaded workflow in one lookup.
+
+        The cached workflow is reused while its file's mtime is unchanged. The
+        mtime is re-checked at most every ACTIVE_RECHECK_INTERVAL seconds, so
+        edits made on disk are picked up shortly after they happen.
 
         Returns:
-            Active Workflow or None
+            Tuple of (active workflow name, Workflow); either may be None
         """
+        if self._active_cache is not None:
+            workflow_name, file_path, mtime_ns, checked_at, workflow = self._active_cache
+
+            now = time.monotonic()
+            if now - checked_at < ACTIVE_RECHECK_INTERVAL:
+                return workflow_name, workflow
+
+            try:
+                if file_path.stat().st_mtime_ns == mtime_ns:
+                    self._active_cache = (workflow_name, file_path, mtime_ns, now, workflow)
+                    return workflow_name, workflow
+            except FileNotFoundError:
+                pass
+
+            # File changed or vanished on disk - force a reload
+            self._workflow_cache.pop(workflow_name, None)
+            self._active_cache = None
+
         workflow_name = self.workflow_store.get_active_workflow()
         if not workflow_name:
-            return None
+            return None, None
 
-        return self.load_workflow(workflow_name)
+        workflow_info = self._get_workflow_info(workflow_name)
+        if not workflow_info:
+            return workflow_name, None
+
+        # Stat before loading so a concurrent edit can only cause an extra reload
+        file_path = workflow_info["_path"]
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return workflow_name, None
+
+        workflow = self.load_workflow(workflow_name)
+        if workflow:
+            self._active_cache = (workflow_name, file_path, mtime_ns, time.monotonic(), workflow)
+
+        return workflow_name, workflow
+
+    def get_active_workflow(self) -> Optional[Workflow]:
+        """Get the active workflow.
+
+        Returns:
+            Active Workflow or None
+        """
+        return self.get_active()[1]
 
     def get_active_workflow_name(self) -> Optional[str]:
         """Get the active workflow name.
@@ -143,6 +313,9 @@ class WorkflowManager:
         Returns:
             Active workflow name or None
         """
+        if self._active_cache is not None:
+            return self._active_cache[0]
+
         return self.workflow_store.get_active_workflow()
 
     def list_workflows(self) -> list:
@@ -162,7 +335,7 @@ class WorkflowManager:
         Returns:
             True if workflow exists, False otherwise
         """
-        return self.workflow_store.workflow_exists(workflow_name)
+        return workflow_name in self.workflow_store
 
     def remove_workflow(self, workflow_name: str) -> bool:
         """Remove a workflow.
@@ -174,15 +347,15 @@ class WorkflowManager:
             True if removed successfully, False otherwise
         """
         # Get workflow info
-        workflow_info = self.workflow_store.get_workflow(workflow_name)
+        workflow_info = self._get_workflow_info(workflow_name)
         if not workflow_info:
             return False
 
         try:
             # Delete file
-            file_path = Path(workflow_info["file_path"])
-            if file_path.exists():
-                file_path.unlink()
+            file_path = workflow_info["_path"]
+            file_path.unlink(missing_ok=True)
+            Path(importlib.util.cache_from_source(str(file_path))).unlink(missing_ok=True)
 
             # Remove from store
             self.workflow_store.remove_workflow(workflow_name)
@@ -190,6 +363,8 @@ class WorkflowManager:
             # Clear cache
             if workflow_name in self._workflow_cache:
                 del self._workflow_cache[workflow_name]
+            self._info_cache.pop(workflow_name, None)
+            self._active_cache = None
 
             logger.info("workflow_removed", workflow=workflow_name)
             return True